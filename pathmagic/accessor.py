@@ -115,7 +115,7 @@ class FileAccessor(Accessor):
         return file if file is not None else self._parent_.new_file(key)
 
     def _get_path_names_(self) -> list[str]:
-        return [clean_filename(item.name) for item in os.scandir(self._parent_) if item.is_file()]
+        return [clean_filename(entry.name) for entry in self._parent_._scandir_entries() if entry.is_file()]
 
 
 class DirAccessor(Accessor):
@@ -134,7 +134,7 @@ class DirAccessor(Accessor):
         return dir if dir is not None else self._parent_.new_dir(key)
 
     def _get_path_names_(self) -> list[str]:
-        return [item.name for item in os.scandir(self._parent_) if item.is_dir()]
+        return [entry.name for entry in self._parent_._scandir_entries() if entry.is_dir()]
 
 
 class AmbiguityError(RuntimeError):
@@ -5,14 +5,14 @@ import os
 import sys
 from pathlib import Path
 import shutil
+import weakref
 import zipfile
 from tempfile import gettempdir
-from typing import Any, Collection, Iterator, Optional, Tuple, Union, cast
+from typing import Any, Collection, Iterable, Iterator, Optional, Tuple, Union, cast
 from types import ModuleType
 
 from appdirs import user_data_dir, site_data_dir
 
-from maybe import Maybe
 from subtypes import Str
 
 from .pathmagic import PathMagic, PathLike, Settings, P
@@ -32,9 +32,12 @@ class Dir(PathMagic):
     of all the contained File and Dir objects, one at a time. Changes to any object property (setting it) will be reflected in the file system.
     """
 
+    __slots__ = ("_cwd_stack", "files", "f", "dirs", "d")
+
     def __init__(self, path: PathLike = "", settings: Settings = None) -> None:
         self._path: Optional[Path] = None
-        self._parent: Optional[Dir] = None
+        self._parent: Optional[Union[Dir, weakref.ref[Dir]]] = None
+        self._stat_cache: Optional[os.stat_result] = None
         self._cwd_stack: list[Path] = []
 
         self.settings = self.Settings.from_settings(settings)
@@ -69,7 +72,7 @@ class Dir(PathMagic):
 
     def __enter__(self) -> Dir:
         self._cwd_stack.append(Path.cwd())
-        os.chdir(str(self))
+        os.chdir(self._path_str)
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
@@ -101,12 +104,12 @@ class Dir(PathMagic):
         return self
 
     def new_copy_to(self, directory: PathLike) -> Dir:
-        """Create a new copy of this Dir within the specified path. If passed a Dir object, both objects will acquire references to each other. Returns the copy."""
+        """Create a new copy of this Dir within the specified path. If passed a Dir object, it will hold the result in its 'dirs' accessor, and the result will refer back to it weakly as its 'parent'. Returns the copy."""
         parent = self.settings.dir_class.from_pathlike(directory, settings=self.settings)
         return parent._bind(self, preserve_original=True)
 
     def copy_to(self, directory: PathLike) -> Dir:
-        """Create a new copy of this Dir within the specified path. If passed a Dir object, both objects will acquire references to each other. Returns self."""
+        """Create a new copy of this Dir within the specified path. If passed a Dir object, it will hold the result in its 'dirs' accessor, and the result will refer back to it weakly as its 'parent'. Returns self."""
         self.new_copy_to(directory)
         return self
 
@@ -117,18 +120,20 @@ class Dir(PathMagic):
         return self
 
     def move_to(self, directory: PathLike) -> Dir:
-        """Move this Dir to the specified path. If passed a Dir object, both objects will acquire references to each other. Returns self."""
+        """Move this Dir to the specified path. If passed a Dir object, it will hold the result in its 'dirs' accessor, and the result will refer back to it weakly as its 'parent'. Returns self."""
         self.settings.dir_class.from_pathlike(directory, settings=self.settings)._bind(self, preserve_original=False)
         return self
 
     def create(self) -> Dir:
         """Create this Dir in the filesystem if it does not exist. This method is called implicitly during instanciation. Returns self."""
         self._prepare_dir_if_not_exists(self.path)
+        self._stat_cache = None
         return self
 
     def delete(self) -> Dir:
         """Delete this Dir object's mapped directory from the file system. The Dir object will persist and may still be used, but the content will not be recoverable."""
         shutil.rmtree(self, ignore_errors=True)
+        self._stat_cache = None
         return self
 
     def clear(self) -> Dir:
@@ -138,6 +143,7 @@ class Dir(PathMagic):
                 pathlike.delete()
 
         self.files(), self.dirs()
+        self._stat_cache = None
 
         return self
 
@@ -151,6 +157,36 @@ class Dir(PathMagic):
         path = self._parse_filename_args(name, extension=extension)
         return self._bind(self.settings.file_class(path, settings=self.settings), preserve_original=True)
 
+    def delete_files(self, files: Iterable[PathLike]) -> Dir:
+        """
+        Delete the given Files (or file names relative to this Dir) from the file system, then synchronize this Dir's 'files' accessor once for the whole batch. Returns self.
+        Every target must be an existing file lying directly within this Dir, otherwise a ValueError is raised before anything is deleted. Targets given more than once are only deleted once.
+        """
+        targets: dict[Path, PathLike] = {}
+
+        for file in files:
+            path = file.path if isinstance(file, PathMagic) else self._path.joinpath(file)
+
+            if path.parent != self._path or path.name in ("", os.curdir, os.pardir):
+                raise ValueError(f"Cannot delete '{path}' from '{self}', since it does not lie directly within it.")
+
+            if isinstance(file, Dir) or not path.is_file():
+                raise ValueError(f"Cannot delete '{path}' from '{self}', since it is not an existing file.")
+
+            if path not in targets or isinstance(file, File):
+                targets[path] = file
+
+        try:
+            for path, file in targets.items():
+                os.remove(path)
+                if isinstance(file, File):
+                    file._stat_cache = None
+        finally:
+            self.files()
+            self._stat_cache = None
+
+        return self
+
     def make_dir(self, name: str) -> Dir:
         """Instantiate a new Dir with the specified name within this Dir. Returns self."""
         self._prepare_dir_if_not_exists(self.path.joinpath(name))
@@ -171,7 +207,7 @@ class Dir(PathMagic):
     def symlink_to(self, target: PathLike, name: str = None) -> None:
         """Create a symlink to the given target. If the name of the symlink is not given, the basename of the target will be used. """
         target = Path(target)
-        Path(self).joinpath(Maybe(name).else_(target.name)).symlink_to(target=target, target_is_directory=target.is_dir())
+        Path(self).joinpath(target.name if name is None else name).symlink_to(target=target, target_is_directory=target.is_dir())
 
     def seek_files(self, depth: int = None, name: str = None, parent_path: str = None, content: str = None, extensions: Collection[str] = None, re_flags: int = 0) -> Iterator[File]:
         """
@@ -346,7 +382,7 @@ class Dir(PathMagic):
 
     def _bind(self, existing_object: P, preserve_original: bool = True) -> P:
         """
-        Acquire a reference to the specified File or Dir in this object's 'files' or 'dirs' accessor, and in return provide that object a reference to this Dir as its 'parent' property.
+        Acquire a reference to the specified File or Dir in this object's 'files' or 'dirs' accessor, and in return provide that object a weak reference to this Dir as its 'parent' property.
         The target File or Dir will be copied and placed in this Dir if the 'preserve_original' argument is true, otherwise it will be moved.
         """
         pathlike = (
@@ -356,7 +392,7 @@ class Dir(PathMagic):
                 )
             )
         )
-        pathlike._parent = self
+        pathlike._parent = weakref.ref(self)  # weak, since this Dir's accessor already holds the child strongly
 
         if issubclass(type(pathlike), File) and issubclass(type(pathlike), Dir):
             raise TypeError(f"Objects to bind must be {File.__name__} or {Dir.__name__} (or some subclass), but may not inherit from both.")
@@ -369,13 +405,13 @@ class Dir(PathMagic):
 
         return pathlike
 
-    def _set_params(self, path: PathLike, move: bool = True) -> None:
-        path_obj = Path(path).resolve()
-
-        if move:
-            shutil.move(self, path_obj)
-
-        self._path, self._parent = path_obj, self._parent if self._parent == path_obj.parent else None
+    def _scandir_entries(self) -> list[os.DirEntry]:
+        """
+        Return the os.DirEntry objects for the direct children of this Dir from a single directory read.
+        The entries' is_file()/is_dir() results come from that read on most platforms, so classifying them costs no further syscalls. The scandir iterator is closed before returning.
+        """
+        with os.scandir(self._path_str) as entries:
+            return list(entries)
 
     def _visualize_tree(self, outlist: list[str], depth: int = None, padding: str = " ",
                         file_inclusion: str = None, file_exclusion: str = None, dir_inclusion: str = None, dir_exclusion: str = None) -> None:
@@ -3,12 +3,12 @@ from __future__ import annotations
 import os
 import shutil
 import sys
+import weakref
 import zipfile
-from typing import Any, Iterator, TYPE_CHECKING, Optional
+from typing import Any, Iterator, TYPE_CHECKING, Optional, Union
 from types import ModuleType
 from pathlib import Path
 
-from maybe import Maybe
 from subtypes import Process
 
 from .pathmagic import PathMagic, PathLike, Settings
@@ -18,6 +18,9 @@ if TYPE_CHECKING:
     from .dir import Dir
 
 
+_python_path: Optional[Path] = None
+
+
 class File(PathMagic):
     """
     ORM class for manipulating files in the filesystem.
@@ -29,9 +32,12 @@ class File(PathMagic):
     filesystem when set.
     """
 
+    __slots__ = ("_format",)
+
     def __init__(self, path: PathLike, settings: Settings = None) -> None:
         self._path: Optional[Path] = None
-        self._parent: Optional[Dir] = None
+        self._parent: Optional[Union[Dir, weakref.ref[Dir]]] = None
+        self._stat_cache: Optional[os.stat_result] = None
 
         self.settings = self.Settings.from_settings(settings)
 
@@ -126,6 +132,7 @@ class File(PathMagic):
     def write(self, val: Any, **kwargs: Any) -> File:
         """Write to this File object's mapped file, overwriting anything already there. Returns self."""
         self.format.write(item=val, **kwargs)
+        self._stat_cache = None
         return self
 
     def write_help(self) -> None:
@@ -140,7 +147,8 @@ class File(PathMagic):
         if not isinstance(self.format, Default):
             raise RuntimeError(f"Cannot 'append' to non-textual File with extension '{self.extension}'.")
 
-        self.format.append(text=val)
+        self.format.write(item=val, append=True)
+        self._stat_cache = None
         return self
 
     def start(self, app: str = None) -> File:
@@ -191,23 +199,25 @@ class File(PathMagic):
         return self
 
     def move_to(self, directory: PathLike) -> File:
-        """Move this File to the specified path. If a Dir object is supplied, both objects will be acquire references to one another. Returns self."""
+        """Move this File to the specified path. If a Dir object is supplied, it will hold this File in its 'files' accessor, and this File will refer back to it weakly as its 'parent'. Returns self."""
         self.settings.dir_class.from_pathlike(directory, settings=self.settings)._bind(self, preserve_original=False)
         return self
 
     def create(self) -> File:
         """Create this File in the filesystem if it does not exist. This method is called implicitly during instanciation. Returns self."""
         self._prepare_file_if_not_exists(self.path)
+        self._stat_cache = None
         return self
 
     def delete(self) -> File:
         """Delete this File object's mapped file from the file system. The File object will persist and may still be used, but the content may not be recoverable."""
-        os.remove(str(self))
+        os.remove(self._path_str)
+        self._stat_cache = None
         return self
 
     def compress(self, name: str = None, **kwargs: Any) -> File:
         """Compress the content of this file into a '.zip' archive of the chosen name, and place it into this File's parent Dir. Then return that zip File. If no name is given, this File's name will be used (plus '.zip' extension)."""
-        outfile: File = self.parent.new_file(f"{Maybe(name).else_(self.name)}.zip")
+        outfile: File = self.parent.new_file(f"{self.name if name is None else name}.zip")
 
         with zipfile.ZipFile(outfile, mode="w", compression=zipfile.ZIP_DEFLATED, **kwargs) as zipper:
             zipper.write(self.path, self.name)
@@ -216,7 +226,13 @@ class File(PathMagic):
 
     @classmethod
     def from_python(cls, settings: Settings = None) -> File:
-        return cls(sys.executable, settings=settings)
+        """Create a File representing the running python interpreter. Its resolved path is computed once per process, since 'sys.executable' cannot change."""
+        global _python_path
+
+        if _python_path is None:
+            _python_path = Path(sys.executable).resolve()
+
+        return cls._from_resolved_path(_python_path, settings=settings)
 
     @classmethod
     def from_main(cls, settings: Settings = None) -> File:
@@ -228,11 +244,3 @@ class File(PathMagic):
         """Create a File representing a non-python resource file within a python package."""
         from .dir import Dir
         return Dir.from_package(package, settings=settings).new_file(name, extension=extension)
-
-    def _set_params(self, path: PathLike, move: bool = True) -> None:
-        new_path = Path(path).resolve()
-
-        if move:
-            shutil.move(self, new_path)
-
-        self._path, self._parent = new_path, self._parent if self._parent == new_path.parent else None
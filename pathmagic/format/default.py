@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict
-
 from typing import Any, Optional, Set, TYPE_CHECKING
 
 from subtypes import Str
@@ -20,20 +18,17 @@ class Default(Format):
 
     @classmethod
     def initialize(cls) -> None:
-        cls.readfuncs = cls.writefuncs = defaultdict(lambda: open)
+        cls.readfuncs = cls.writefuncs = {}
 
-    def read(self, **kwargs: Any) -> Optional[Str]:
+    def read(self, *, encoding: str = "utf-8", **kwargs: Any) -> Optional[Str]:
         try:
-            true_kwargs = {'encoding': "utf-8"} | kwargs
-            with open(self.file, mode='r') as file_handle:
+            with open(self.file, encoding=encoding, **kwargs) as file_handle:
                 return Str(file_handle.read())
         except UnicodeDecodeError:
             return None
 
-    def write(self, item: Any, append: bool = False, **kwargs: Any) -> None:
-        true_kwargs = {'encoding': "utf-8"} | kwargs | {'mode': 'a' if append else 'w'}
-
-        with open(self.file, **true_kwargs) as file_handle:
+    def write(self, item: Any, append: bool = False, *, mode: str = None, encoding: str = "utf-8", **kwargs: Any) -> None:
+        with open(self.file, mode=('a' if append else 'w') if mode is None else mode, encoding=encoding, **kwargs) as file_handle:
             if item is None:
                 pass
             elif isinstance(item, str):
@@ -42,3 +37,9 @@ class Default(Format):
                 file_handle.write("\n".join([str(line) for line in item]))
             else:
                 file_handle.write(str(item))
+
+    def read_help(self) -> None:
+        help(open)
+
+    def write_help(self) -> None:
+        help(open)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-
 from abc import ABCMeta
-from typing import Any, Callable, Optional, Type, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Type, TYPE_CHECKING
 
 from subtypes import Str, NameSpace
 
@@ -15,7 +15,8 @@ if TYPE_CHECKING:
 
 class FormatHandler:
     """A class to manage file formats and react accordingly by file extension when reading and writing to/from files."""
-    extensions: dict[str, Type[Format]] = {}
+    _registry: dict[str, Type[Format]] = {}
+    extensions: Mapping[str, Type[Format]] = MappingProxyType(_registry)
     formats = NameSpace()
 
     def __init__(self, file: File):
@@ -67,7 +68,7 @@ class FormatHandler:
         if formatter_class.extensions is None:
             raise TypeError(f"Cannot register {Format.__name__} subclass {formatter_class.__name__} without valid extensions")
 
-        cls.extensions.update({extension: formatter_class for extension in (formatter_class.extensions or {})})
+        cls._registry.update({extension: formatter_class for extension in formatter_class.extensions})
         cls.formats[formatter_class.__name__] = NameSpace({str(Str(extension).case.constant()): extension for extension in formatter_class.extensions})
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import pathlib
+from typing import Any
 
 from pathmagic.helper import PathLike
 
@@ -10,17 +11,19 @@ from .format import Format
 
 class Link(Format):
     extensions = {"lnk"}
+    shell: Any = None
 
     @classmethod
     def initialize(cls) -> None:
         import win32com.client as win
+
         cls.module = win
+        cls.shell = cls.module.Dispatch("WScript.Shell")
         cls.readfuncs.update({"lnk": cls._readlink})
         cls.writefuncs.update({"lnk": cls._writelink})
 
     def _readlink(self, linkpath: PathLike) -> PathLike:
-        shell = self.module.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(os.path.realpath(linkpath))
+        shortcut = self.shell.CreateShortCut(os.path.realpath(linkpath))
         path = pathlib.Path(shortcut.Targetpath)
 
         if path.is_file():
@@ -33,7 +36,6 @@ class Link(Format):
         return constructor(path)
 
     def _writelink(self, item: PathLike, linkpath: PathLike) -> None:
-        shell = self.module.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(os.path.realpath(linkpath))
+        shortcut = self.shell.CreateShortCut(os.path.realpath(linkpath))
         shortcut.Targetpath = os.path.realpath(item)
         shortcut.save()
@@ -13,18 +13,18 @@ if TYPE_CHECKING:
 
 class Serialized(Format):
     extensions = {"pkl"}
+    serializer_class: Any = None
 
     def __init__(self, file: File) -> None:
-        from iotools import Serializer
-
         super().__init__(file=file)
-        self.serializer = Serializer(file)
+        self.serializer = self.serializer_class(file)
 
     @classmethod
     def initialize(cls) -> None:
         import dill
+        from iotools import Serializer
 
-        cls.module = dill
+        cls.module, cls.serializer_class = dill, Serializer
         cls.readfuncs.update({"pkl": cls.module.load})
         cls.writefuncs.update({"pkl": cls.module.dump})
 
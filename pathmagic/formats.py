@@ -4,8 +4,8 @@ import json
 import tarfile
 import zipfile
 from abc import ABCMeta
-from types import MethodType
-from typing import Any, Callable, TYPE_CHECKING
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Mapping, TYPE_CHECKING
 
 from subtypes import Str, Html, Xml, TranslatableMeta
 
@@ -17,13 +17,14 @@ if TYPE_CHECKING:
 
 
 class FormatMeta(ABCMeta):
-    extensions: dict[str, type[Format]] = {}
+    _registry: dict[str, type[Format]] = {}
+    extensions: Mapping[str, type[Format]] = MappingProxyType(_registry)
 
     def __new__(mcs, name: str, bases: Any, namespace: dict) -> type[Format]:
         cls: type[Format] = super().__new__(mcs, name, bases, namespace)
 
         if cls.extensions:
-            mcs.extensions.update({extension: cls for extension in cls.extensions})
+            mcs._registry.update({extension: cls for extension in cls.extensions})
 
         return cls
 
@@ -196,12 +197,20 @@ class Compressed(Format):
 
 class Pickle(Format):
     extensions = {'pkl', 'pickle'}
+    _serializer_class: type = None
 
     def __init__(self, file: File) -> None:
-        from iotools import Serializer
-
         super().__init__(file=file)
-        self.serializer = Serializer(file)
+        self.serializer = self._get_serializer_class()(file)
+
+    @classmethod
+    def _get_serializer_class(cls) -> type:
+        if cls._serializer_class is None:
+            from iotools import Serializer
+
+            cls._serializer_class = Serializer
+
+        return cls._serializer_class
 
     @property
     def reader(self) -> Callable:
@@ -276,20 +285,15 @@ class Markup(Format):
 class Default(Format):
     extensions: set[str] = set()
 
-    def read(self, **kwargs: Any) -> Str:
-        kwargs = {'encoding': 'utf-8'} | kwargs
-
-        with open(self.file, **kwargs) as stream:
+    def read(self, *, encoding: str = 'utf-8', **kwargs: Any) -> Str:
+        with open(self.file, encoding=encoding, **kwargs) as stream:
             return Str(stream.read())
 
-    def write(self, item: Any, append: bool = False, **kwargs: Any) -> None:
-        if item is None:
-            return
-
-        kwargs = {'mode': 'a' if append else 'w', 'encoding': 'utf-8'} | kwargs
-
-        with open(self.file, **kwargs) as stream:
-            if isinstance(item, str):
+    def write(self, item: Any, append: bool = False, *, mode: str = None, encoding: str = 'utf-8', **kwargs: Any) -> None:
+        with open(self.file, mode=('a' if append else 'w') if mode is None else mode, encoding=encoding, **kwargs) as stream:
+            if item is None:
+                pass
+            elif isinstance(item, str):
                 stream.write(item)
             elif isinstance(item, list):
                 stream.write('\n'.join(str(line) for line in item))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 import os
 from pathlib import Path
@@ -16,8 +17,13 @@ def is_special(attribute: str) -> bool:
 
 
 def clean_filename(name: str) -> str:
-    stem, _, ext = name.partition(".")
-    return stem if not ext else f"{stem}.{ext.lower()}"
+    stem, ext = os.path.splitext(name)
+    return stem + ext.lower()
+
+
+@lru_cache(maxsize=128)
+def normalize_extension(extension: str) -> str:
+    return f".{extension.strip('.').lower()}"
 
 
 PathLike = Union[str, os.PathLike, Path]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import os
-from typing import Any, TYPE_CHECKING, TypeVar
+import shutil
+import weakref
+from contextvars import ContextVar
+from typing import Any, Optional, TYPE_CHECKING, TypeVar, Union
 from pathlib import Path
 
-from send2trash import send2trash
-
-from .helper import PathLike
+from .helper import PathLike, normalize_extension
 from .settings import Settings
 from .enums import Enums
 
@@ -14,47 +15,116 @@ if TYPE_CHECKING:
     from .dir import Dir
 
 
-class PathMagic(os.PathLike):
+_send2trash = None
+
+
+def _trash(path: PathLike) -> None:
+    """Move the given path to the OS' recycling bin. The 'send2trash' module is only imported the first time this is called, since it loads platform-specific bindings."""
+    global _send2trash
+
+    if _send2trash is None:
+        from send2trash import send2trash as _send2trash
+
+    _send2trash(str(path))
+
+
+def _allow_existing(pathmagic: PathMagic, path: Path) -> None:
+    pass
+
+
+def _trash_existing(pathmagic: PathMagic, path: Path) -> None:
+    _trash(path)
+
+
+def _fail_existing(pathmagic: PathMagic, path: Path) -> None:
+    raise FileExistsError(f"'{path}' already exists and current setting is '{pathmagic.settings.if_exists}'. To change this behaviour change the '{type(pathmagic).__name__}.settings.if_exists' attribute.")
+
+
+def _unknown_if_exists(pathmagic: PathMagic, path: Path) -> None:
+    raise NotImplementedError
+
+
+_IF_EXISTS_HANDLERS = {
+    Enums.IfExists.ALLOW: _allow_existing,
+    Enums.IfExists.TRASH: _trash_existing,
+    Enums.IfExists.FAIL: _fail_existing,
+}
+
+
+# The already-resolved path a '_from_resolved_path' call is currently constructing from. '_set_params' only skips 'Path.resolve()' for this exact object,
+# so the public constructor of a user-supplied 'file_class'/'dir_class' only ever receives a plain pathlib.Path
+_resolved_path: ContextVar[Optional[Path]] = ContextVar("_resolved_path", default=None)
+
+
+class PathMagic:
     """Abstract Base Class from which 'File' and 'Dir' objects derive."""
 
     Enums = Enums
     Settings = Settings
 
-    __subclasshook__ = object.__subclasshook__
+    __slots__ = ("_path", "_path_str", "_parent", "_stat_cache", "_hash", "settings", "__weakref__")
 
     settings: Settings
     _path: Path
-    _parent: Dir
+    _path_str: str
+    _parent: Union[Dir, weakref.ref[Dir]]
+    _stat_cache: os.stat_result
+    _hash: int
 
     def __init__(self, *args: Any, **kwargs: Any):
         raise NotImplementedError(f"Cannot instanciate object of abstract type {type(self).__name__}. Please instanciate one of its subclasses.")
 
     def __str__(self) -> str:
-        return str(self.path)
+        return self._path_str
 
     def __fspath__(self) -> str:
-        return str(self)
+        return self._path_str
 
     def __hash__(self) -> int:
-        return id(self)
+        """
+        Hash by the resolved path, consistent with '__eq__'. The hash therefore changes whenever this object is renamed or moved,
+        so an object stored in a set or used as a dict key will not be found there again after its path changes.
+        """
+        if self._hash is None:
+            self._hash = hash(self._path)
+
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
-        return self.path == Path(other).absolute()
+        if self is other:
+            return True
+
+        if isinstance(other, PathMagic):
+            return self._path == other._path
+
+        if isinstance(other, (str, os.PathLike)):
+            return self._path == self._as_abs(other)
+
+        return NotImplemented
 
     def __ne__(self, other: Any) -> bool:
         return not (self == other)
 
     def __lt__(self, other: Any) -> bool:
-        return str(self).startswith(str(Path(other).absolute())) and not self == other
+        return self._is_within(self._path_str, other_path := self._abs_str(other)) and self._path_str != other_path
 
     def __le__(self, other: Any) -> bool:
-        return str(self).startswith(str(Path(other).absolute()))
+        return self._is_within(self._path_str, self._abs_str(other))
 
     def __gt__(self, other: Any) -> bool:
-        return str(Path(other).absolute()).startswith(str(self)) and not self == other
+        return self._is_within(other_path := self._abs_str(other), self._path_str) and self._path_str != other_path
 
     def __ge__(self, other: Any) -> bool:
-        return str(Path(other).absolute()).startswith(str(self))
+        return self._is_within(self._abs_str(other), self._path_str)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {slot: getattr(self, slot) for cls in type(self).__mro__ for slot in getattr(cls, "__slots__", ()) if slot != "__weakref__" and hasattr(self, slot)}
+        state["_parent"] = None  # a weakly referenced parent cannot be pickled, so it is left to be rebuilt lazily by the 'parent' property after loading
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for slot, val in state.items():
+            setattr(self, slot, val)
 
     @property
     def path(self) -> Path:
@@ -68,9 +138,11 @@ class PathMagic(os.PathLike):
     @property
     def parent(self) -> Dir:
         """Return or set the parent directory as a Dir object."""
-        if self._parent is None:
-            self._parent = self.settings.dir_class(os.path.dirname(self), settings=self.settings)
-        return self._parent
+        if (parent := self._dereference_parent()) is None:
+            # a Dir built here holds no reference back to this object, so keeping it strongly creates no cycle and spares rebuilding it on every access
+            parent = self._parent = self.settings.dir_class._from_resolved_path(self._path.parent, settings=self.settings)
+
+        return parent
 
     @parent.setter
     def parent(self, val: Dir) -> None:
@@ -87,7 +159,20 @@ class PathMagic(os.PathLike):
 
     @property
     def stat(self) -> os.stat_result:
-        return os.stat(str(self))
+        """Return a fresh os.stat_result of this path. Use 'PathMagic.stat_cached' instead when reading several fields in a row."""
+        return self._path.stat()
+
+    def stat_cached(self) -> os.stat_result:
+        """Return the os.stat_result of this path, only querying the file system the first time. The cached result is discarded whenever this object moves, creates, deletes or writes to its path."""
+        if self._stat_cache is None:
+            self._stat_cache = self._path.stat()
+
+        return self._stat_cache
+
+    def refresh_stat(self) -> os.stat_result:
+        """Discard the cached os.stat_result of this path, re-query the file system and return the fresh result."""
+        self._stat_cache = None
+        return self.stat_cached()
 
     def create(self) -> PathMagic:
         raise NotImplementedError
@@ -100,7 +185,8 @@ class PathMagic(os.PathLike):
 
     def trash(self) -> PathMagic:
         """Move this object's mapped path to your OS' implementation of a recycling bin. The object will persist and may still be used."""
-        send2trash(str(self))
+        _trash(self)
+        self._stat_cache = None
         return self
 
     def delete(self) -> PathMagic:
@@ -108,39 +194,93 @@ class PathMagic(os.PathLike):
 
     @classmethod
     def from_pathlike(cls, pathlike: PathLike, settings: Settings = None) -> PathMagic:
-        return pathlike if isinstance(pathlike, cls) else cls(path=pathlike, settings=settings)
+        if isinstance(pathlike, cls):
+            return pathlike
+
+        if isinstance(pathlike, PathMagic):
+            return cls._from_resolved_path(pathlike._path, settings=pathlike.settings if settings is None else settings)
+
+        return cls(path=pathlike, settings=settings)
+
+    @classmethod
+    def _from_resolved_path(cls, path: Path, settings: Settings = None) -> PathMagic:
+        """Instanciate from a path that is already absolute and fully resolved (such as the parent of another PathMagic's path), without resolving it again."""
+        token = _resolved_path.set(path)
+        try:
+            return cls(path, settings=settings)
+        finally:
+            _resolved_path.reset(token)
+
+    @staticmethod
+    def _as_abs(other: Any) -> Path:
+        if isinstance(other, PathMagic):
+            return other._path
+
+        path = other if isinstance(other, Path) else Path(other)
+        return path if path.is_absolute() else path.absolute()
+
+    @staticmethod
+    def _abs_str(other: Any) -> str:
+        return other._path_str if isinstance(other, PathMagic) else os.path.abspath(other)
+
+    @staticmethod
+    def _is_within(path: str, ancestor: str) -> bool:
+        return path == ancestor or path.startswith(ancestor if ancestor.endswith(os.sep) else ancestor + os.sep)
+
+    def _dereference_parent(self) -> Optional[Dir]:
+        """
+        Return this object's cached parent Dir, or None if there is none. A Dir that bound this object (and so holds it in an accessor) is only referenced weakly to avoid a reference cycle,
+        and yields None once it has been garbage-collected. A parent built lazily by the 'parent' property is held strongly, since it does not refer back to this object.
+        """
+        parent = self._parent
+        return parent() if isinstance(parent, weakref.ref) else parent
 
     def _validate(self, path: Path) -> None:
-        if self == path:
+        try:
+            target_stat = os.lstat(path)
+        except FileNotFoundError:
+            return
+
+        if self._path == path or self._is_same_file(target_stat):
             raise FileExistsError(f"'{path}' is already this {type(self).__name__}'s path. Cannot copy or move a {type(self).__name__} to its own path.")
-        else:
-            if path.exists():
-                if self.settings.if_exists is self.Enums.IfExists.ALLOW:
-                    pass
-                elif self.settings.if_exists is self.Enums.IfExists.TRASH:
-                    send2trash(str(path))
-                elif self.settings.if_exists is self.Enums.IfExists.FAIL:
-                    raise FileExistsError(f"'{path}' already exists and current setting is '{self.settings.if_exists}'. To change this behaviour change the '{type(self).__name__}.settings.if_exists' attribute.")
-                else:
-                    raise NotImplementedError
+
+        _IF_EXISTS_HANDLERS.get(self.settings.if_exists, _unknown_if_exists)(self, path)
+
+    def _is_same_file(self, target_stat: os.stat_result) -> bool:
+        try:
+            return os.path.samestat(target_stat, os.lstat(self._path))
+        except FileNotFoundError:
+            return False
 
     def _prepare_dir_if_not_exists(self, path: Path) -> None:
-        path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
 
     def _prepare_file_if_not_exists(self, path: Path) -> None:
         self._prepare_dir_if_not_exists(path.parent)
 
-        if not path.is_file():
-            path.touch(exist_ok=True)
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+        except FileExistsError:
+            if not os.path.isfile(path):
+                raise
 
     def _parse_filename_args(self, name: str, /, extension: str = None) -> Path:
-        raw = self.path.joinpath(name)
+        raw = self._path.joinpath(name)
+
+        if extension is not None:
+            return raw.with_suffix(normalize_extension(extension))
+
+        suffix = raw.suffix
+        return raw if suffix == suffix.lower() else raw.with_suffix(suffix.lower())
+
+    def _set_params(self, path: PathLike, move: bool = True) -> None:
+        new_path = path if path is _resolved_path.get() else Path(path).resolve()
+
+        if move:
+            shutil.move(self, new_path)
 
-        return (
-            raw.with_suffix(raw.suffix.lower())
-            if extension is None else
-            raw.with_suffix(f".{extension.strip('.').lower()}")
-        )
+        self._path, self._path_str, self._parent = new_path, str(new_path), self._parent if self._dereference_parent() == new_path.parent else None
+        self._stat_cache = self._hash = None
 
 
 P = TypeVar("P", bound=PathMagic)
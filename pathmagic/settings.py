@@ -12,17 +12,18 @@ if TYPE_CHECKING:
 class Settings:
     """A Settings class for PathMagic objects. Holds the constructors that PathMagic objects will use when they need to instanciate relatives, as well as controlling other aspects of behaviour."""
 
+    __slots__ = ("if_exists", "file_class", "dir_class")
+
     DEFAULT: Settings = None
 
     def __init__(self, if_exists: Enums.IfExists, file_class: Type[File], dir_class: Type[Dir]) -> None:
         self.if_exists, self.file_class, self.dir_class = if_exists, file_class, dir_class
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
+        return f"{type(self).__name__}({', '.join([f'{attr}={repr(getattr(self, attr))}' for attr in self.__slots__])})"
 
     @classmethod
     def from_settings(cls, settings: Settings = None) -> Settings:
-        if settings is None:
-            return cls.from_settings(cls.DEFAULT)
-
-        return cls(if_exists=settings.if_exists, file_class=settings.file_class, dir_class=settings.dir_class)
+        """Return a copy of the given Settings, or of 'Settings.DEFAULT' if none are given. A copy is always made, since each PathMagic object's settings may be modified independently."""
+        template = cls.DEFAULT if settings is None else settings
+        return cls(if_exists=template.if_exists, file_class=template.file_class, dir_class=template.dir_class)
@@ -1,12 +1,24 @@
+import os
+import sys
+import tempfile
+
 import pytest
 
 from pathmagic import Dir, File
 
+# tmpfs is memory-backed, so prefer it over a possibly disk-backed TMPDIR on linux
+TEMP_PARENT = "/dev/shm" if sys.platform == "linux" and os.access("/dev/shm", os.W_OK) else None
+
 
 @pytest.fixture()
 def temp_root() -> Dir:
-    with Dir.from_temp() as temp:
+    # a unique directory per test, since the one shared by 'Dir.from_temp()' is cleared on entry and would collide under pytest-xdist
+    temp = Dir(tempfile.mkdtemp(prefix="pathmagic-", dir=TEMP_PARENT))
+
+    try:
         yield temp
+    finally:
+        temp.delete()
 
 
 @pytest.fixture()
@@ -19,6 +31,18 @@ def temp_file(temp_root: Dir) -> File:
     return temp_root.new_file('testing', 'txt').write('testing...')
 
 
+@pytest.fixture(scope="session")
+def readonly_temp_file(tmp_path_factory: pytest.TempPathFactory) -> File:
+    # shared by the whole session, so only request this from tests that never move, rename, write to or delete the file
+    (path := tmp_path_factory.mktemp("readonly") / "testing.txt").write_text("testing...")
+    return File(path)
+
+
+@pytest.fixture()
+def temp_lines_file(temp_root: Dir) -> File:
+    return temp_root.new_file('lines', 'txt').write('line1\nline2\nline3')
+
+
 @pytest.fixture()
 def appdata_dir() -> Dir:
     appdata_dir = Dir.from_appdata(app_name='testing', app_author='testing')
@@ -26,6 +50,12 @@ def appdata_dir() -> Dir:
     appdata_dir.delete()
 
 
+def scandir_map(path: os.PathLike) -> dict[str, os.DirEntry]:
+    """Read a directory once and return its entries keyed by name, so that several existence checks can share a single listing."""
+    with os.scandir(path) as entries:
+        return {entry.name: entry for entry in entries}
+
+
 untestable = pytest.mark.skip(reason="untestable")
 abstract = pytest.mark.skip(reason="abstract")
 unnecessary = pytest.mark.skip(reason="unnecessary")
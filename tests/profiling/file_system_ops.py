@@ -3,15 +3,17 @@ import os
 from miscutils import Profiler
 
 testdir = Dir.from_home().new_dir("test")
-testdir.settings.lazy = True
+testdir_path = str(testdir)
 run = 1000
 
+new_file, remove, join = testdir.new_file, os.remove, os.path.join
+
 
 print("pathmagic")
 
 with Profiler() as magic_create_profiler:
-    for num in range(run):
-        testdir.new_file(f"test{num + 1}", "txt").write(f"Hi, I'm file number {num + 1}.")
+    for num in range(1, run + 1):
+        new_file(f"test{num}", "txt").write(f"Hi, I'm file number {num}.")
 
 print(magic_create_profiler)
 
@@ -25,14 +27,14 @@ print(magic_delete_profiler)
 print("standard")
 
 with Profiler() as standard_create_profiler:
-    for num in range(run):
-        with open(fR"{testdir}\test{num + 1}.txt", "w") as stream:
-            stream.write(f"Hi, I'm file number {num + 1}.")
+    for num in range(1, run + 1):
+        with open(join(testdir_path, f"test{num}.txt"), "w") as stream:
+            stream.write(f"Hi, I'm file number {num}.")
 
 print(standard_create_profiler)
 
 with Profiler() as standard_delete_profiler:
-    for file in os.listdir(str(testdir)):
-        os.remove(f"{testdir}/{file}")
+    for file in os.listdir(testdir_path):
+        remove(join(testdir_path, file))
 
 print(standard_delete_profiler)
@@ -3,6 +3,7 @@ import tempfile
 from pathlib import Path
 
 import appdirs
+import pytest
 from pathmagic import Dir, File
 
 from tests.conftest import untestable, unnecessary
@@ -159,6 +160,24 @@ class TestDir:
         file = temp_dir.new_file('temp', 'csv')
         assert file.parent is temp_dir and file == file.path and file.path.exists()
 
+    def test_delete_files(self, temp_root: Dir, temp_dir: Dir, temp_file: File):  # synced
+        first, second = temp_dir.new_file('first', 'txt'), temp_dir.new_file('second', 'txt')
+
+        for outsider in (temp_file, str(temp_file), os.path.join('..', temp_file.name)):
+            with pytest.raises(ValueError):
+                temp_dir.delete_files([first, outsider])
+
+        assert first.path.exists() and temp_file.path.exists()
+
+        for non_file in (temp_dir.new_dir('nested'), 'nested', 'missing.txt'):
+            with pytest.raises(ValueError):
+                temp_dir.delete_files([first, non_file])
+
+        assert first.path.exists() and (temp_dir.path / 'nested').is_dir()
+
+        assert temp_dir.delete_files([first, 'second.txt', 'first.txt', second, first]) is temp_dir
+        assert not temp_dir.files() and not first.path.exists() and not second.path.exists()
+
     def test_make_dir(self, temp_dir: Dir):  # synced
         dir = temp_dir.make_dir('temp')
         assert dir is temp_dir and (dir.path / 'temp').exists()
@@ -278,6 +297,10 @@ class TestDir:
     def test__set_params(self):  # synced
         assert True
 
+    def test__scandir_entries(self, temp_root: Dir, temp_dir: Dir, temp_file: File):  # synced
+        entries = {entry.name: entry for entry in temp_root._scandir_entries()}
+        assert set(entries) == {temp_dir.name, temp_file.name} and entries[temp_dir.name].is_dir() and entries[temp_file.name].is_file()
+
     @untestable
     def test__visualize_tree(self):  # synced
         assert True
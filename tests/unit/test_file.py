@@ -1,8 +1,13 @@
 import sys
 
+import pytest
+
 from pathmagic import Dir, File
 
-from tests.conftest import untestable, unnecessary
+from tests.conftest import untestable, unnecessary, scandir_map
+
+
+EXPECTED = b"testing..."
 
 
 class TestFile:
@@ -16,23 +21,23 @@ class TestFile:
         temp_file.content = None
         assert not temp_file
 
-    def test___iter__(self, temp_file: File):  # synced
-        first_line, = list(temp_file)
-        assert first_line == "testing..."
+    def test___iter__(self, readonly_temp_file: File):  # synced
+        lines = iter(readonly_temp_file)
+        assert next(lines) == "testing..."
 
-    def test___getitem__(self, temp_file: File):  # synced
-        temp_file.write("line1\nline2\nline3")
-        assert temp_file[0] == "line1" and temp_file[1] == "line2" and temp_file[2] == "line3"
+        with pytest.raises(StopIteration):
+            next(lines)
 
-    def test___setitem__(self, temp_file: File):  # synced
-        temp_file.write("line1\nline2\nline3")
-        temp_file[1] = "LINE2"
-        assert temp_file.read() == "line1\nLINE2\nline3"
+    def test___getitem__(self, temp_lines_file: File):  # synced
+        assert temp_lines_file[0] == "line1" and temp_lines_file[1] == "line2" and temp_lines_file[2] == "line3"
 
-    def test___delitem__(self, temp_file: File):  # synced
-        temp_file.write("line1\nline2\nline3")
-        del temp_file[1]
-        assert temp_file.read() == "line1\nline3"
+    def test___setitem__(self, temp_lines_file: File):  # synced
+        temp_lines_file[1] = "LINE2"
+        assert temp_lines_file.read() == "line1\nLINE2\nline3"
+
+    def test___delitem__(self, temp_lines_file: File):  # synced
+        del temp_lines_file[1]
+        assert temp_lines_file.read() == "line1\nline3"
 
     def test_stem(self, temp_file: File):  # synced
         assert temp_file.stem == 'testing'
@@ -41,11 +46,13 @@ class TestFile:
         temp_file.stem = 'renamed'
         new_path = temp_file.path
 
+        names = scandir_map(new_path.parent)
+
         assert (
-                not old_path.exists()
-                and new_path.exists()
+                old_path.name not in names
+                and new_path.name in names
                 and old_path.parent == new_path.parent
-                and new_path.read_text() == "testing..."
+                and new_path.read_bytes() == EXPECTED
                 and new_path.name == 'renamed.txt'
         )
 
@@ -56,11 +63,13 @@ class TestFile:
         temp_file.extension = 'json'
         new_path = temp_file.path
 
+        names = scandir_map(new_path.parent)
+
         assert (
-                not old_path.exists()
-                and new_path.exists()
+                old_path.name not in names
+                and new_path.name in names
                 and old_path.parent == new_path.parent
-                and new_path.read_text() == "testing..."
+                and new_path.read_bytes() == EXPECTED
                 and new_path.name == 'testing.json'
         )
 
@@ -72,8 +81,8 @@ class TestFile:
 
         assert temp_file.path.read_text() == NEW_CONTENT
 
-    def test_read(self, temp_file: File):  # synced
-        assert temp_file.read() == 'testing...'
+    def test_read(self, readonly_temp_file: File):  # synced
+        assert readonly_temp_file.read() == 'testing...'
 
     @untestable
     def test_read_help(self):  # synced
@@ -101,11 +110,13 @@ class TestFile:
         file = temp_file.rename('renamed', 'json')
         new_path = file.path
 
+        names = scandir_map(new_path.parent)
+
         assert (
-            not old_path.exists()
-            and new_path.exists()
+            old_path.name not in names
+            and new_path.name in names
             and old_path.parent == new_path.parent
-            and new_path.read_text() == "testing..."
+            and new_path.read_bytes() == EXPECTED
             and new_path.name == 'renamed.json'
             and file == new_path
         )
@@ -115,12 +126,14 @@ class TestFile:
         file = temp_file.new_rename('renamed', 'json')
         new_path = file.path
 
+        names = scandir_map(new_path.parent)
+
         assert (
-            old_path.exists()
-            and new_path.exists()
+            old_path.name in names
+            and new_path.name in names
             and old_path.parent == new_path.parent
-            and old_path.read_text() == "testing..."
-            and new_path.read_text() == "testing..."
+            and old_path.read_bytes() == EXPECTED
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'renamed.json'
             and file == new_path
@@ -130,12 +143,14 @@ class TestFile:
         old_path = temp_file.path
         file = temp_file.new_copy(new_path := (temp_root.path / 'temp' / 'renamed.json'))
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            old_path.exists()
-            and new_path.exists()
+            old_path.name in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and old_path.read_text() == "testing..."
-            and new_path.read_text() == "testing..."
+            and old_path.read_bytes() == EXPECTED
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'renamed.json'
             and file == new_path
@@ -145,12 +160,14 @@ class TestFile:
         old_path = temp_file.path
         file = temp_file.copy(new_path := (temp_root.path / 'temp' / 'renamed.json'))
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            old_path.exists()
-            and new_path.exists()
+            old_path.name in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and old_path.read_text() == "testing..."
-            and new_path.read_text() == "testing..."
+            and old_path.read_bytes() == EXPECTED
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'renamed.json'
             and file == old_path
@@ -161,12 +178,14 @@ class TestFile:
         file = temp_file.new_copy_to(temp := (temp_root.path / 'temp'))
         new_path = temp / old_path.name
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            old_path.exists()
-            and new_path.exists()
+            old_path.name in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and old_path.read_text() == "testing..."
-            and new_path.read_text() == "testing..."
+            and old_path.read_bytes() == EXPECTED
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'testing.txt'
             and file == new_path
@@ -177,12 +196,14 @@ class TestFile:
         file = temp_file.copy_to(temp := (temp_root.path / 'temp'))
         new_path = temp / old_path.name
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            old_path.exists()
-            and new_path.exists()
+            old_path.name in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and old_path.read_text() == "testing..."
-            and new_path.read_text() == "testing..."
+            and old_path.read_bytes() == EXPECTED
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'testing.txt'
             and file == old_path
@@ -192,11 +213,13 @@ class TestFile:
         old_path = temp_file.path
         file = temp_file.move(new_path := (temp_root.path / 'temp' / 'renamed.json'))
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            not old_path.exists()
-            and new_path.exists()
+            old_path.name not in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and new_path.read_text() == "testing..."
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'renamed.json'
             and file == new_path
@@ -207,31 +230,42 @@ class TestFile:
         file = temp_file.move_to(temp := (temp_root.path / 'temp'))
         new_path = temp / old_path.name
 
+        old_entries, new_entries = scandir_map(old_path.parent), scandir_map(new_path.parent)
+
         assert (
-            not old_path.exists()
-            and new_path.exists()
+            old_path.name not in old_entries
+            and new_path.name in new_entries
             and old_path.parent == new_path.parent.parent
-            and new_path.read_text() == "testing..."
+            and new_path.read_bytes() == EXPECTED
             and old_path.name == 'testing.txt'
             and new_path.name == 'testing.txt'
             and file == new_path
         )
 
     def test_create(self, temp_file: File):  # synced
+        path = temp_file.path
+        assert path.exists()
+
         temp_file.delete()
+        assert not path.exists()
+
         temp_file.create()
-        assert temp_file.path.exists()
+        temp_file.create()  # test idempotency
+        assert path.exists()
 
-    def test_delete(self, temp_file: File):  # synced
         temp_file.delete()
-        assert not temp_file.path.exists()
+        assert not path.exists()
+
+    @unnecessary
+    def test_delete(self):  # synced
+        assert True
 
     @untestable
     def test_compress(self):  # synced
         assert True
 
     def test_from_python(self):  # synced
-        assert File.from_python() == sys.executable
+        assert File.from_python() == sys.executable and File.from_python().path is File.from_python().path
 
     @untestable
     def test_from_main(self):  # synced
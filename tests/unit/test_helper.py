@@ -1,6 +1,6 @@
 # import pytest
 
-from pathmagic.helper import is_special, clean_filename
+from pathmagic.helper import is_special, clean_filename, normalize_extension
 
 from tests.conftest import untestable
 
@@ -16,3 +16,9 @@ def test_is_special():  # synced
 
 def test_clean_filename():  # synced
     assert clean_filename('Raw.TXT') == 'Raw.txt'
+    assert clean_filename('Raw.Tar.GZ') == 'Raw.Tar.gz'
+    assert clean_filename('Raw') == 'Raw'
+
+
+def test_normalize_extension():  # synced
+    assert normalize_extension('TXT') == normalize_extension('.txt') == '.txt'
@@ -1,9 +1,18 @@
+import gc
+import operator
 import os
+import pickle
 from pathlib import Path
+from typing import Callable
+
+import pytest
 
 from pathmagic import Dir, File
 
-from tests.conftest import abstract
+from tests.conftest import abstract, unnecessary, scandir_map
+
+
+EXPECTED = b"testing..."
 
 
 class TestPathMagic:
@@ -11,32 +20,66 @@ class TestPathMagic:
         class TestIfExists:
             pass
 
-    def test___str__(self, temp_file: File):  # synced
-        assert str(temp_file) == os.fspath(temp_file)
+    def test___str__(self, readonly_temp_file: File):  # synced
+        expected = os.fspath(readonly_temp_file)
+        assert str(readonly_temp_file) == expected
 
-    def test___fspath__(self, temp_file: File):  # synced
-        assert os.fspath(temp_file) == os.fspath(temp_file.path)
+    def test___fspath__(self, readonly_temp_file: File):  # synced
+        fspath = os.fspath(readonly_temp_file.path)
+        assert os.fspath(readonly_temp_file) == fspath
+        assert isinstance(readonly_temp_file, os.PathLike) and not hasattr(readonly_temp_file, '__dict__')
 
-    def test___hash__(self, temp_file: File):  # synced
-        assert hash(temp_file) == id(temp_file)
+    def test___hash__(self, readonly_temp_file: File):  # synced
+        path, expected = readonly_temp_file.path, hash(readonly_temp_file)
+        assert expected == hash(path) == hash(File(path)) and readonly_temp_file._hash == expected
 
-    def test___eq__(self, temp_file: File):  # synced
-        assert temp_file == temp_file.path and temp_file == str(temp_file)
+    def test___eq__(self, readonly_temp_file: File):  # synced
+        path = readonly_temp_file.path
+        assert readonly_temp_file == path and readonly_temp_file == str(path)
+        assert readonly_temp_file == File(path) and readonly_temp_file != 1
 
     def test___ne__(self, temp_dir: Dir, temp_file: File):  # synced
-        assert temp_dir != temp_file.path and temp_dir != str(temp_file)
+        path = temp_file.path
+        assert temp_dir != path and temp_dir != str(path)
+
+    @pytest.mark.parametrize("op, expected", [
+        (operator.lt, (True, False, False)),
+        (operator.le, (True, True, False)),
+        (operator.gt, (False, False, False)),
+        (operator.ge, (False, True, False)),
+    ])
+    def test_ordering(self, temp_root: Dir, temp_dir: Dir, temp_file: File, op: Callable, expected: tuple[bool, bool, bool]):
+        sibling = temp_root.new_dir(f"{temp_dir.name}2")
+        assert (op(temp_file, temp_root), op(temp_root, temp_root), op(sibling, temp_dir)) == expected
+
+    @unnecessary
+    def test___lt__(self):  # synced
+        assert True
+
+    @unnecessary
+    def test___le__(self):  # synced
+        assert True
+
+    @unnecessary
+    def test___gt__(self):  # synced
+        assert True
 
-    def test___lt__(self, temp_root: Dir, temp_file: File):  # synced
-        assert temp_file < temp_root and not temp_root < temp_root
+    @unnecessary
+    def test___ge__(self):  # synced
+        assert True
 
-    def test___le__(self, temp_root: Dir, temp_file: File):  # synced
-        assert temp_file <= temp_root <= temp_root
+    def test___getstate__(self, temp_root: Dir, temp_file: File):  # synced
+        assert temp_file._dereference_parent() is temp_root and temp_file.__getstate__()["_parent"] is None
 
-    def test___gt__(self, temp_root: Dir, temp_file: File):  # synced
-        assert temp_root > temp_file and not temp_root > temp_root
+        loaded = pickle.loads(pickle.dumps(temp_file))
+        assert loaded == temp_file and loaded.settings.if_exists == temp_file.settings.if_exists
+        assert loaded._dereference_parent() is None and loaded.parent == temp_root
 
-    def test___ge__(self, temp_root: Dir, temp_file: File):  # synced
-        assert temp_root >= temp_root >= temp_file
+    def test___setstate__(self, temp_root: Dir, temp_dir: Dir, temp_file: File):  # synced
+        loaded = pickle.loads(pickle.dumps(temp_root))
+        assert loaded == temp_root and loaded.parent == temp_root.parent
+        assert set(loaded.files()) == set(temp_root.files()) and set(loaded.dirs()) == set(temp_root.dirs())
+        assert loaded.files[temp_file.name] == temp_file and loaded.dirs[temp_dir.name] == temp_dir
 
     def test_path(self, temp_root: Dir, temp_dir: Dir, temp_file: File):  # synced
         assert isinstance(temp_dir.path, Path) and isinstance(temp_file.path, Path)
@@ -62,7 +105,7 @@ class TestPathMagic:
             not old_file_path.exists()
             and new_file_path.exists()
             and old_file_path.parent == new_file_path.parent.parent
-            and new_file_path.read_text() == "testing..."
+            and new_file_path.read_bytes() == EXPECTED
             and new_file_path.name == 'renamed.json'
         )
 
@@ -90,7 +133,7 @@ class TestPathMagic:
             not old_file_path.exists()
             and new_file_path.exists()
             and old_file_path.parent == new_file_path.parent.parent
-            and new_file_path.read_text() == "testing..."
+            and new_file_path.read_bytes() == EXPECTED
             and new_file_path.name == 'testing.txt'
         )
 
@@ -101,9 +144,11 @@ class TestPathMagic:
         temp_dir.name = 'renamed'
         new_dir_path = temp_dir.path
 
+        names = scandir_map(new_dir_path.parent)
+
         assert (
-            not old_dir_path.exists()
-            and new_dir_path.exists()
+            old_dir_path.name not in names
+            and new_dir_path.name in names
             and old_dir_path.parent == new_dir_path.parent
             and new_dir_path.name == 'renamed'
         )
@@ -112,16 +157,33 @@ class TestPathMagic:
         temp_file.name = 'renamed.json'
         new_file_path = temp_file.path
 
+        names = scandir_map(new_file_path.parent)
+
         assert (
-            not old_file_path.exists()
-            and new_file_path.exists()
+            old_file_path.name not in names
+            and new_file_path.name in names
             and old_file_path.parent == new_file_path.parent
-            and new_file_path.read_text() == "testing..."
+            and new_file_path.read_bytes() == EXPECTED
             and new_file_path.name == 'renamed.json'
         )
 
-    def test_stat(self, temp_file: File):  # synced
-        assert isinstance(temp_file.stat, os.stat_result)
+    def test_stat(self, readonly_temp_file: File):  # synced
+        assert isinstance(readonly_temp_file.stat, os.stat_result)
+
+    def test_stat_cached(self, temp_file: File):  # synced
+        size = temp_file.stat_cached().st_size
+        temp_file.path.write_text("testing123...")
+
+        assert temp_file.stat_cached().st_size == size and temp_file.stat.st_size != size
+
+        temp_file.write("testing123456...")
+        assert temp_file.stat_cached().st_size == len("testing123456...")
+
+    def test_refresh_stat(self, temp_file: File):  # synced
+        size = temp_file.stat_cached().st_size
+        temp_file.path.write_text("testing123...")
+
+        assert temp_file.refresh_stat().st_size != size and temp_file.stat_cached().st_size != size
 
     @abstract
     def test_create(self):  # synced
@@ -146,21 +208,59 @@ class TestPathMagic:
     def test_from_pathlike(self, temp_file: File):  # synced
         assert File.from_pathlike(temp_file) is temp_file and temp_file == File.from_pathlike(str(temp_file))
 
-    def test__validate(self):  # synced
-        assert True
+        class SubFile(File):
+            def __init__(self, path, settings=None):
+                self.received = path
+                super().__init__(path, settings=settings)
+
+        assert isinstance(sub := SubFile.from_pathlike(temp_file), SubFile) and sub == temp_file and sub.settings is not temp_file.settings
+        assert type(sub.received) is type(temp_file.path) and str(sub.received) == str(temp_file)
+
+    def test__dereference_parent(self, temp_root: Dir, temp_file: File):  # synced
+        assert temp_file._dereference_parent() is temp_root
+
+        orphan = File(temp_file.path)
+        assert orphan._dereference_parent() is None and orphan.parent == temp_root
+        assert orphan._dereference_parent() is orphan.parent
+
+        child = Dir(temp_root.path / 'bound').new_file('child', 'txt')
+        gc.collect()
+        assert child._dereference_parent() is None and child.parent == temp_root.path / 'bound'
+
+    def test__validate(self, temp_root: Dir, temp_file: File):  # synced
+        other = temp_root.new_file('testing2', 'txt')
+
+        temp_file.settings.if_exists = temp_file.Enums.IfExists.ALLOW
+        temp_file._validate(other.path)
+
+        temp_file.settings.if_exists = temp_file.Enums.IfExists.FAIL
+        with pytest.raises(FileExistsError):
+            temp_file._validate(other.path)
+
+        with pytest.raises(FileExistsError):
+            temp_file._validate(temp_file.path)
+
+        temp_file.delete()
+        with pytest.raises(FileExistsError):
+            temp_file._validate(other.path)
 
     def test__prepare_dir_if_not_exists(self, temp_dir: Dir):  # synced
         new_path = temp_dir.path / 'temp'
         temp_dir._prepare_dir_if_not_exists(new_path)
+        inode = new_path.stat().st_ino
+
         temp_dir._prepare_dir_if_not_exists(new_path)  # test idempotency
-        assert new_path.exists()
+        assert new_path.is_dir() and new_path.stat().st_ino == inode
 
     def test__prepare_file_if_not_exists(self, temp_dir: Dir):  # synced
         new_path = temp_dir.path / 'temp.txt'
         temp_dir._prepare_file_if_not_exists(new_path)
+        new_path.write_text('testing...')
+        inode = new_path.stat().st_ino
+
         temp_dir._prepare_file_if_not_exists(new_path)  # test idempotency
-        assert new_path.exists()
+        assert new_path.stat().st_ino == inode and new_path.read_bytes() == EXPECTED
 
-    def test__parse_filename_args(self, temp_dir: Dir):  # synced
-        assert temp_dir._parse_filename_args('hi', 'txt').name == 'hi.txt'
-        assert temp_dir._parse_filename_args('hi.txt').name == 'hi.txt'
+    @pytest.mark.parametrize("args, expected", [(('hi', 'txt'), 'hi.txt'), (('hi.txt',), 'hi.txt'), (('hi', '.TXT'), 'hi.txt'), (('hi.TXT',), 'hi.txt')])
+    def test__parse_filename_args(self, temp_dir: Dir, args: tuple, expected: str):  # synced
+        assert temp_dir._parse_filename_args(*args).name == expected
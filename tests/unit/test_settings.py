@@ -5,13 +5,19 @@ from pathmagic.settings import Settings
 from pathmagic.pathmagic import PathMagic
 
 
+FAIL = PathMagic.Enums.IfExists.FAIL
+
+
 class TestSettings:
     def test_from_settings(self):  # synced
-        template_settings = Settings(if_exists=PathMagic.Enums.IfExists.FAIL, file_class=File, dir_class=Dir)
+        template_settings = Settings(if_exists=FAIL, file_class=File, dir_class=Dir)
         new_settings = Settings.from_settings(template_settings)
 
         assert (
-            template_settings.if_exists == new_settings.if_exists
+            new_settings.if_exists is FAIL
             and template_settings.file_class == new_settings.file_class
             and template_settings.dir_class == new_settings.dir_class
         )
+
+        default_settings = Settings.from_settings()
+        assert default_settings is not Settings.DEFAULT and default_settings.if_exists is Settings.DEFAULT.if_exists